@@ -0,0 +1,46 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+_cache: Dict[str, Tuple[Any, float]] = {}
+_locks: Dict[str, asyncio.Lock] = {}
+_versions: Dict[str, int] = {}
+
+
+async def get_cached(key: str, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Returns the cached value for the given key, calling the loader to refresh it once the entry is older than the TTL.
+    Concurrent misses for the same key wait for a single loader call instead of each hitting the database.
+    A value loaded while the key was invalidated is returned to the caller but not stored.
+
+    Args:
+        key (str): The cache key.
+        ttl (float): Number of seconds a loaded value stays valid.
+        loader (Callable[[], Awaitable[Any]]): Coroutine factory producing a fresh value.
+
+    Returns:
+        Any: The cached or freshly loaded value.
+    """
+    entry = _cache.get(key)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    async with _locks.setdefault(key, asyncio.Lock()):
+        entry = _cache.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        version = _versions.get(key, 0)
+        value = await loader()
+        if _versions.get(key, 0) == version:
+            _cache[key] = (value, time.monotonic() + ttl)
+        return value
+
+
+def invalidate(key: str) -> None:
+    """
+    Drops the cached value for the given key so the next lookup hits the database, and discards any load already in flight.
+
+    Args:
+        key (str): The cache key to invalidate.
+    """
+    _versions[key] = _versions.get(key, 0) + 1
+    _cache.pop(key, None)
@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+import prisma
+import prisma.models
+
+
+async def batch_find_users(ids: List[str]) -> List[Optional[prisma.models.User]]:
+    """
+    Fetches several users with their roles by ID using a single find_many with an IN (...) filter, instead of one find_unique per ID.
+
+    Args:
+        ids (List[str]): The unique identifiers of the users to fetch.
+
+    Returns:
+        List[Optional[prisma.models.User]]: The users in the same order as the given IDs, with None for IDs that do not exist.
+    """
+    users = await prisma.models.User.prisma().find_many(
+        where={"id": {"in": ids}}, include={"roles": True}
+    )
+    users_by_id = {user.id: user for user in users}
+    return [users_by_id.get(user_id) for user_id in ids]
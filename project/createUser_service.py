@@ -3,7 +3,7 @@ from typing import List
 import prisma
 import prisma.enums
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateUserResponse(BaseModel):
@@ -11,6 +11,8 @@ class CreateUserResponse(BaseModel):
     This model represents the response after creating a new user in the system. It provides confirmation of the created record with minimal user data.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     username: str
     email: str
@@ -31,13 +33,18 @@ async def createUser(
     Returns:
         CreateUserResponse: This model represents the response after creating a new user in the system. It provides confirmation of the created record with minimal user data.
     """
-    new_user = await prisma.models.User.prisma().create(
-        data={"email": email, "roles": {"create": [{"role": role} for role in roles]}},
-        include={"roles": True},
-    )
-    return CreateUserResponse(
+    roles = list(dict.fromkeys(prisma.enums.Role(role) for role in roles))
+    async with prisma.get_client().tx() as transaction:
+        new_user = await prisma.models.User.prisma(transaction).create(
+            data={"email": email}
+        )
+        if roles:
+            await prisma.models.UserRole.prisma(transaction).create_many(
+                data=[{"userId": new_user.id, "role": role} for role in roles]
+            )
+    return CreateUserResponse.model_construct(
         id=new_user.id,
         username=username,
         email=new_user.email,
-        roles=[ur.role for ur in new_user.roles],
+        roles=roles,
     )
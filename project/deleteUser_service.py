@@ -1,6 +1,6 @@
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DeleteUserResponse(BaseModel):
@@ -8,6 +8,8 @@ class DeleteUserResponse(BaseModel):
     Response model indicating the outcome of the delete operation. It will primarily communicate the success or any errors.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
 
@@ -30,8 +32,7 @@ async def deleteUser(userId: str, confirmation: bool) -> DeleteUserResponse:
     """
     if not confirmation:
         return DeleteUserResponse(success=False, message="Deletion not confirmed.")
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if not user:
+    deleted_user = await prisma.models.User.prisma().delete(where={"id": userId})
+    if not deleted_user:
         return DeleteUserResponse(success=False, message="User not found.")
-    await prisma.models.User.prisma().delete(where={"id": userId})
     return DeleteUserResponse(success=True, message="User successfully deleted.")
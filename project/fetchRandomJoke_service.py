@@ -1,17 +1,11 @@
+import asyncio
 from typing import Optional
 
 import httpx
 import prisma
 import prisma.models
-from pydantic import BaseModel
-
-
-class RandomJokeRequest(BaseModel):
-    """
-    This request model is used for retrieving a random joke. It's a simple GET request without any parameters, reflecting the accessibility and simplicity of this public endpoint.
-    """
-
-    pass
+from project._ttl_cache import get_cached
+from pydantic import BaseModel, ConfigDict
 
 
 class RandomJokeResponse(BaseModel):
@@ -19,37 +13,59 @@ class RandomJokeResponse(BaseModel):
     The model for the response when fetching a random joke. It returns a joke in JSON format that includes the content of the joke.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     joke_content: str
     source: Optional[str] = None
 
 
-async def fetchRandomJoke(request: RandomJokeRequest) -> RandomJokeResponse:
+async def fetchRandomJoke(client: httpx.AsyncClient) -> RandomJokeResponse:
     """
     This endpoint retrieves a random joke from an external joke service or the database. It uses a GET request to ensure simplicity and accessibility. The response is expected to be a JSON object containing the joke text. This endpoint is publicly accessible, allowing any API user to request a random joke without authentication.
 
     Args:
-        request (RandomJokeRequest): This request model is used for retrieving a random joke. It's a simple GET request without any parameters, reflecting the accessibility and simplicity of this public endpoint.
+        client (httpx.AsyncClient): Shared HTTP client used to query the external joke sources.
 
     Returns:
         RandomJokeResponse: The model for the response when fetching a random joke. It returns a joke in JSON format that includes the content of the joke.
     """
-    async with httpx.AsyncClient() as client:
-        joke_sources = await prisma.models.JokeSource.prisma().find_many()
-        if joke_sources:
-            for source in joke_sources:
+    joke_sources = await get_cached(
+        "joke_sources", 60, lambda: prisma.models.JokeSource.prisma().find_many()
+    )
+    if joke_sources:
+        tasks = [
+            asyncio.create_task(_fetch_from_source(client, source))
+            for source in joke_sources
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
                 try:
-                    response = await client.get(source.endpoint)
-                    response.raise_for_status()
-                    joke_content = response.json()["joke"]
-                    return RandomJokeResponse(
-                        joke_content=joke_content, source=source.name
-                    )
-                except (httpx.RequestError, httpx.HTTPStatusError, KeyError):
+                    return await next_done
+                except (
+                    httpx.RequestError,
+                    httpx.HTTPStatusError,
+                    KeyError,
+                    TypeError,
+                    ValueError,
+                ):
                     continue
-    joke_record = await prisma.models.Joke.prisma().find_first()
+        finally:
+            for task in tasks:
+                task.cancel()
+    joke_record = await prisma.get_client().query_first(
+        'SELECT content, source FROM "Joke" ORDER BY random() LIMIT 1'
+    )
     if joke_record:
-        return RandomJokeResponse(
-            joke_content=joke_record.content, source=joke_record.source
+        return RandomJokeResponse.model_construct(
+            joke_content=joke_record["content"], source=joke_record["source"]
         )
     else:
         raise Exception("No available jokes in external sources or local database.")
+
+
+async def _fetch_from_source(
+    client: httpx.AsyncClient, source: prisma.models.JokeSource
+) -> RandomJokeResponse:
+    response = await client.get(source.endpoint)
+    response.raise_for_status()
+    return RandomJokeResponse(joke_content=response.json()["joke"], source=source.name)
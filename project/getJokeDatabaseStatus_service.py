@@ -1,16 +1,11 @@
+import asyncio
 from datetime import datetime
+from typing import Optional, Tuple
 
 import prisma
 import prisma.models
-from pydantic import BaseModel
-
-
-class JokeStatusRequest(BaseModel):
-    """
-    No specific input required other than authentication which is handled separately. But since this endpoint requires very specific user roles, those roles will be validated upon processing the request.
-    """
-
-    pass
+from project._ttl_cache import get_cached
+from pydantic import BaseModel, ConfigDict
 
 
 class JokeStatusResponse(BaseModel):
@@ -18,29 +13,32 @@ class JokeStatusResponse(BaseModel):
     Provides an overview of the joke database's current status, including count of jokes and the last updated timestamp.
     """
 
-    last_update: datetime
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    last_update: Optional[datetime] = None
     total_jokes: int
 
 
-async def getJokeDatabaseStatus(request: JokeStatusRequest) -> JokeStatusResponse:
+async def getJokeDatabaseStatus() -> JokeStatusResponse:
     """
     Provides a status report on the joke database, including the last update time and the total number of jokes available. Useful for database managers and system administrators to monitor and manage the database effectively. This is a protected endpoint, needing authentication for access.
 
-    Args:
-        request (JokeStatusRequest): No specific input required other than authentication which is handled separately. But since this endpoint requires very specific user roles, those roles will be validated upon processing the request.
-
     Returns:
         JokeStatusResponse: Provides an overview of the joke database's current status, including count of jokes and the last updated timestamp.
 
     Example:
-        request = JokeStatusRequest()
-        response = await getJokeDatabaseStatus(request)
+        response = await getJokeDatabaseStatus()
         print(response.last_update, response.total_jokes)
     """
-    latest_joke = await prisma.models.Joke.prisma().find_first(
-        order={"createdAt": "desc"}
+    last_update, total_jokes = await get_cached("jokes", 30, _load_joke_status)
+    return JokeStatusResponse.model_construct(
+        last_update=last_update, total_jokes=total_jokes
     )
-    total_jokes = await prisma.models.Joke.prisma().count()
-    return JokeStatusResponse(
-        last_update=latest_joke.createdAt, total_jokes=total_jokes
+
+
+async def _load_joke_status() -> Tuple[Optional[datetime], int]:
+    latest_joke, total_jokes = await asyncio.gather(
+        prisma.models.Joke.prisma().find_first(order={"createdAt": "desc"}),
+        prisma.models.Joke.prisma().count(),
     )
+    return (latest_joke.createdAt if latest_joke else None, total_jokes)
@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime
 from typing import List, Optional
 
 import prisma
 import prisma.enums
-import prisma.models
-from pydantic import BaseModel
+import prisma.partials
+from pydantic import BaseModel, ConfigDict
 
 
 class UserRole(BaseModel):
@@ -12,6 +13,8 @@ class UserRole(BaseModel):
     Determines the access level and permissions of a user.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     role: prisma.enums.Role
 
 
@@ -20,6 +23,8 @@ class APIRequestModel(BaseModel):
     Definition of API requests made by a user with details on request timing and endpoint accessed.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     createdAt: datetime
     endpoint: str
@@ -31,6 +36,8 @@ class UserDetailsResponse(BaseModel):
     Response model containing detailed information of a user. Includes sensitive details, hence access is restricted.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     email: str
     createdAt: datetime
@@ -39,12 +46,13 @@ class UserDetailsResponse(BaseModel):
     requests: List[APIRequestModel]
 
 
-async def getUserDetails(userId: str) -> UserDetailsResponse:
+async def getUserDetails(userId: str, requestsLimit: int = 50) -> UserDetailsResponse:
     """
     Fetches details for a specific user given the user ID. This secure endpoint ensures that sensitive user information is only accessible to System Administrators.
 
     Args:
     userId (str): The unique identifier of the user to fetch details for.
+    requestsLimit (int): Maximum number of most recent API requests to include.
 
     Returns:
     UserDetailsResponse: Response model containing detailed information of a user. Includes sensitive details, hence access is restricted.
@@ -52,22 +60,30 @@ async def getUserDetails(userId: str) -> UserDetailsResponse:
     Example:
     user_details = await getUserDetails('123')
     """
-    user = await prisma.models.User.prisma().find_unique(
-        where={"id": userId}, include={"roles": True, "requests": True}
+    user, requests = await asyncio.gather(
+        prisma.partials.UserSummary.prisma().find_unique(
+            where={"id": userId}, include={"roles": True}
+        ),
+        prisma.partials.APIRequestSummary.prisma().find_many(
+            where={"userId": userId}, take=requestsLimit, order={"createdAt": "desc"}
+        ),
     )
     if user is None:
         raise ValueError("User not found.")
-    user_roles = [UserRole(role=role.role) for role in user.roles]
+    user_roles = [
+        UserRole.model_construct(role=prisma.enums.Role(role.role))
+        for role in user.roles
+    ]
     user_requests = [
-        APIRequestModel(
+        APIRequestModel.model_construct(
             id=req.id,
             createdAt=req.createdAt,
             endpoint=req.endpoint,
             response=req.response,
         )
-        for req in user.requests
+        for req in requests
     ]
-    return UserDetailsResponse(
+    return UserDetailsResponse.model_construct(
         id=user.id,
         email=user.email,
         createdAt=user.createdAt,
@@ -1,18 +1,10 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 import prisma
 import prisma.enums
-import prisma.models
-from pydantic import BaseModel
-
-
-class GetUsersRequest(BaseModel):
-    """
-    Request model for retrieving all users. As there are no parameters required for this request, the primary consideration here is authorization, which is managed outside the parameters of this model.
-    """
-
-    pass
+import prisma.partials
+from pydantic import BaseModel, ConfigDict
 
 
 class RoleDetails(BaseModel):
@@ -20,6 +12,8 @@ class RoleDetails(BaseModel):
     Details of a user's role.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     role: prisma.enums.Role
 
 
@@ -28,6 +22,8 @@ class UserDetails(BaseModel):
     Details of an individual user, including their roles.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     email: str
     createdAt: datetime
@@ -40,30 +36,41 @@ class GetUsersResponse(BaseModel):
     Response model containing a list of users. Each user is detailed with necessary attributes such as id, email, and associated roles.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     users: List[UserDetails]
 
 
-async def listUsers(request: GetUsersRequest) -> GetUsersResponse:
+async def listUsers(limit: int = 50, cursor: Optional[str] = None) -> GetUsersResponse:
     """
     Provides a list of all users registered in the system. Accessible by System Administrators, this endpoint assists in managing users and supports pagination to efficiently handle large data sets.
 
     Args:
-        request (GetUsersRequest): Request model for retrieving all users. As there are no parameters required for this request, the primary consideration here is authorization, which is managed outside the parameters of this model.
+        limit (int): Maximum number of users to return in one page.
+        cursor (Optional[str]): ID of the last user of the previous page; the page starts right after it.
 
     Returns:
         GetUsersResponse: Response model containing a list of users. Each user is detailed with necessary attributes such as id, email, and associated roles.
     """
-    prisma_users = await prisma.models.User.prisma().find_many(include={"roles": True})
-    users_details = []
-    for user in prisma_users:
-        roles = [RoleDetails(role=srole.role) for srole in user.roles]
-        user_detail = UserDetails(
+    prisma_users = await prisma.partials.UserSummary.prisma().find_many(
+        take=limit,
+        skip=1 if cursor else None,
+        cursor={"id": cursor} if cursor else None,
+        order={"id": "asc"},
+        include={"roles": True},
+    )
+    users_details = [
+        UserDetails.model_construct(
             id=user.id,
             email=user.email,
             createdAt=user.createdAt,
             updatedAt=user.updatedAt,
-            roles=roles,
+            roles=[
+                RoleDetails.model_construct(role=prisma.enums.Role(srole.role))
+                for srole in user.roles
+            ],
         )
-        users_details.append(user_detail)
-    response = GetUsersResponse(users=users_details)
+        for user in prisma_users
+    ]
+    response = GetUsersResponse.model_construct(users=users_details)
     return response
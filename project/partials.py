@@ -0,0 +1,17 @@
+"""
+Partial model definitions used by `prisma generate` to build column-limited models in `prisma.partials`.
+"""
+
+from prisma.models import APIRequest, User, UserRole
+
+UserRole.create_partial("UserRoleName", include={"role"})
+
+APIRequest.create_partial(
+    "APIRequestSummary", include={"id", "createdAt", "endpoint", "response"}
+)
+
+User.create_partial(
+    "UserSummary",
+    include={"id", "email", "createdAt", "updatedAt", "roles"},
+    relations={"roles": "UserRoleName"},
+)
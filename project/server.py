@@ -1,7 +1,9 @@
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Any, Callable, Coroutine, List, Optional
 
+import httpx
 import prisma
 import prisma.enums
 import project.createUser_service
@@ -12,95 +14,122 @@ import project.getUserDetails_service
 import project.listUsers_service
 import project.updateJokeServiceSettings_service
 import project.updateUser_service
-from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
+from fastapi import FastAPI, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.routing import APIRoute
 from prisma import Prisma
+from starlette.exceptions import HTTPException
 
 logger = logging.getLogger(__name__)
 
+TRACEBACK_LOG_INTERVAL = 60.0
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+RANDOM_JOKE_CACHE_CONTROL = "public, max-age=1, stale-while-revalidate=5"
+JOKE_STATUS_CACHE_CONTROL = "private, max-age=30"
+
+_last_traceback_at: dict[str, float] = {}
+
 db_client = Prisma(auto_register=True)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db_client.connect()
+    app.state.http = httpx.AsyncClient(
+        timeout=2.0, limits=httpx.Limits(max_keepalive_connections=32)
+    )
     yield
+    await app.state.http.aclose()
     await db_client.disconnect()
 
 
+def log_once(exc: Exception) -> None:
+    """
+    Logs a request error, including the full traceback at most once per TRACEBACK_LOG_INTERVAL for each exception class.
+    """
+    key = type(exc).__name__
+    now = time.monotonic()
+    last = _last_traceback_at.get(key)
+    if last is None or now - last >= TRACEBACK_LOG_INTERVAL:
+        _last_traceback_at[key] = now
+        logger.error("Error processing request", exc_info=exc)
+    else:
+        logger.error("Error processing request: %s: %s", key, exc)
+
+
 app = FastAPI(
     title="joker203",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="create a single api that returns one random joke using litellm",
 )
 
 
+class ErrorResponseRoute(APIRoute):
+    """
+    Route that turns unhandled service errors into a JSON 500 response itself, so they never reach Starlette's ServerErrorMiddleware, which would re-raise them and log another traceback.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def handle(request: Request) -> Response:
+            try:
+                return await route_handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                log_once(e)
+                return ORJSONResponse({"error": str(e)}, status_code=500)
+
+        return handle
+
+
+app.router.route_class = ErrorResponseRoute
+
+
 @app.get(
     "/jokes/random", response_model=project.fetchRandomJoke_service.RandomJokeResponse
 )
-async def api_get_fetchRandomJoke(
-    request: project.fetchRandomJoke_service.RandomJokeRequest,
-) -> project.fetchRandomJoke_service.RandomJokeResponse | Response:
+async def api_get_fetchRandomJoke() -> ORJSONResponse:
     """
     This endpoint retrieves a random joke from an external joke service or the database. It uses a GET request to ensure simplicity and accessibility. The response is expected to be a JSON object containing the joke text. This endpoint is publicly accessible, allowing any API user to request a random joke without authentication.
     """
-    try:
-        res = await project.fetchRandomJoke_service.fetchRandomJoke(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.fetchRandomJoke_service.fetchRandomJoke(client=app.state.http)
+    return ORJSONResponse(
+        content=res.model_dump(),
+        headers={"Cache-Control": RANDOM_JOKE_CACHE_CONTROL},
+    )
 
 
 @app.post("/users", response_model=project.createUser_service.CreateUserResponse)
 async def api_post_createUser(
     roles: List[prisma.enums.Role], username: str, email: str
-) -> project.createUser_service.CreateUserResponse | Response:
+) -> ORJSONResponse:
     """
     Creates a new user record in the system database. This endpoint is protected to ensure only authorized administrators manage user access.
     """
-    try:
-        res = await project.createUser_service.createUser(roles, username, email)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.createUser_service.createUser(
+        username=username, email=email, roles=roles
+    )
+    return ORJSONResponse(content=res.model_dump())
 
 
 @app.delete(
     "/users/{userId}", response_model=project.deleteUser_service.DeleteUserResponse
 )
-async def api_delete_deleteUser(
-    userId: str, confirmation: bool
-) -> project.deleteUser_service.DeleteUserResponse | Response:
+async def api_delete_deleteUser(userId: str, confirmation: bool) -> ORJSONResponse:
     """
     Deletes a user from the system using the user ID. This action is irreversible and strictly limited to System Administrators to maintain data integrity and security.
     """
-    try:
-        res = await project.deleteUser_service.deleteUser(userId, confirmation)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.deleteUser_service.deleteUser(
+        userId=userId, confirmation=confirmation
+    )
+    return ORJSONResponse(content=res.model_dump())
 
 
 @app.post(
@@ -109,69 +138,41 @@ async def api_delete_deleteUser(
 )
 async def api_post_updateJokeServiceSettings(
     apiKey: Optional[str], serviceUrl: Optional[str]
-) -> project.updateJokeServiceSettings_service.UpdateJokeSettingsResponse | Response:
+) -> ORJSONResponse:
     """
     Allows system administrators to update settings related to the external joke service or database configurations. The endpoint expects JSON payload with settings options and returns a success or error message upon execution. This operations is protected and requires administrator authentication.
     """
-    try:
-        res = await project.updateJokeServiceSettings_service.updateJokeServiceSettings(
-            apiKey, serviceUrl
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.updateJokeServiceSettings_service.updateJokeServiceSettings(
+        apiKey=apiKey, serviceUrl=serviceUrl
+    )
+    return ORJSONResponse(content=res.model_dump())
 
 
 @app.get("/users", response_model=project.listUsers_service.GetUsersResponse)
 async def api_get_listUsers(
-    request: project.listUsers_service.GetUsersRequest,
-) -> project.listUsers_service.GetUsersResponse | Response:
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> ORJSONResponse:
     """
     Provides a list of all users registered in the system. Accessible by System Administrators, this endpoint assists in managing users and supports pagination to efficiently handle large data sets.
     """
-    try:
-        res = await project.listUsers_service.listUsers(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.listUsers_service.listUsers(limit=limit, cursor=cursor)
+    return ORJSONResponse(content=res.model_dump())
 
 
 @app.get(
     "/admin/jokes/status",
     response_model=project.getJokeDatabaseStatus_service.JokeStatusResponse,
 )
-async def api_get_getJokeDatabaseStatus(
-    request: project.getJokeDatabaseStatus_service.JokeStatusRequest,
-) -> project.getJokeDatabaseStatus_service.JokeStatusResponse | Response:
+async def api_get_getJokeDatabaseStatus() -> ORJSONResponse:
     """
     Provides a status report on the joke database, including the last update time and the total number of jokes available. Useful for database managers and system administrators to monitor and manage the database effectively. This is a protected endpoint, needing authentication for access.
     """
-    try:
-        res = await project.getJokeDatabaseStatus_service.getJokeDatabaseStatus(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.getJokeDatabaseStatus_service.getJokeDatabaseStatus()
+    return ORJSONResponse(
+        content=res.model_dump(),
+        headers={"Cache-Control": JOKE_STATUS_CACHE_CONTROL},
+    )
 
 
 @app.get(
@@ -179,22 +180,15 @@ async def api_get_getJokeDatabaseStatus(
 )
 async def api_get_getUserDetails(
     userId: str,
-) -> project.getUserDetails_service.UserDetailsResponse | Response:
+    requestsLimit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> ORJSONResponse:
     """
     Fetches details for a specific user given the user ID. This secure endpoint ensures that sensitive user information is only accessible to System Administrators.
     """
-    try:
-        res = await project.getUserDetails_service.getUserDetails(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.getUserDetails_service.getUserDetails(
+        userId=userId, requestsLimit=requestsLimit
+    )
+    return ORJSONResponse(content=res.model_dump())
 
 
 @app.put(
@@ -202,19 +196,11 @@ async def api_get_getUserDetails(
 )
 async def api_put_updateUser(
     userId: str, email: Optional[str], roles: List[project.updateUser_service.UserRole]
-) -> project.updateUser_service.UpdateUserResponse | Response:
+) -> ORJSONResponse:
     """
     Updates a user's details based on the provided user ID. Requires JSON input with updateable user attributes and can be used only by System Administrators to manage user information.
     """
-    try:
-        res = await project.updateUser_service.updateUser(userId, email, roles)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.updateUser_service.updateUser(
+        userId=userId, email=email, roles=roles
+    )
+    return ORJSONResponse(content=res.model_dump())
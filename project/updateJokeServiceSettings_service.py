@@ -2,7 +2,10 @@ from typing import Optional
 
 import prisma
 import prisma.models
-from pydantic import BaseModel
+from project._ttl_cache import invalidate
+from pydantic import BaseModel, ConfigDict
+
+DEFAULT_JOKE_SOURCE = "default"
 
 
 class UpdateJokeSettingsResponse(BaseModel):
@@ -10,6 +13,8 @@ class UpdateJokeSettingsResponse(BaseModel):
     Response model for updating joke settings indicating success or failure.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
 
@@ -19,7 +24,7 @@ async def updateJokeServiceSettings(
 ) -> UpdateJokeSettingsResponse:
     """
     Allows system administrators to update settings related to the external joke service.
-    The function attempts to update the joke service settings in the database and returns a response model indicating success or failure.
+    The function updates the joke source named "default", falling back to the oldest joke source when no such source exists, and returns a response model indicating success or failure.
 
     Args:
         apiKey (Optional[str]): API key for external joke service.
@@ -29,17 +34,24 @@ async def updateJokeServiceSettings(
         UpdateJokeSettingsResponse: Response model for updating joke settings indicating success or failure.
     """
     try:
-        joke_sources = await prisma.models.JokeSource.prisma().find_many()
-        if joke_sources:
-            joke_source = joke_sources[0]
-            update_data = {}
-            if apiKey is not None:
-                update_data["apiKey"] = apiKey
-            if serviceUrl is not None:
-                update_data["endpoint"] = serviceUrl
-            await prisma.models.JokeSource.prisma().update(
-                where={"id": joke_source.id}, data=update_data
+        update_data = {}
+        if apiKey is not None:
+            update_data["apiKey"] = apiKey
+        if serviceUrl is not None:
+            update_data["endpoint"] = serviceUrl
+        joke_source = await prisma.models.JokeSource.prisma().update(
+            where={"name": DEFAULT_JOKE_SOURCE}, data=update_data
+        )
+        if joke_source is None:
+            oldest_source = await prisma.models.JokeSource.prisma().find_first(
+                order={"createdAt": "asc"}
             )
+            if oldest_source:
+                joke_source = await prisma.models.JokeSource.prisma().update(
+                    where={"id": oldest_source.id}, data=update_data
+                )
+        if joke_source:
+            invalidate("joke_sources")
             return UpdateJokeSettingsResponse(
                 success=True, message="Joke service settings updated successfully."
             )
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 import prisma
 import prisma.enums
 import prisma.models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserRole(BaseModel):
@@ -19,6 +19,8 @@ class UpdateUserResponse(BaseModel):
     Confirmation of successful update along with the updated user details.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     userId: str
     updatedFields: Dict[str, Any]
@@ -39,25 +41,32 @@ async def updateUser(
     Returns:
         UpdateUserResponse: Contains success status, user ID, and a dictionary of fields that were updated.
     """
-    user = await prisma.models.User.prisma().find_unique(
-        where={"id": userId}, include={"roles": True}
-    )
-    if not user:
-        return UpdateUserResponse(success=False, userId=userId, updatedFields={})
-    update_data = {"email": email} if email else {}
     updated_roles_data = []
-    if roles:
-        await prisma.models.UserRole.prisma().delete_many(where={"userId": userId})
-        for role in roles:
-            new_role = await prisma.models.UserRole.prisma().create(
-                data={"role": role.role, "userId": userId}
-            )
-            updated_roles_data.append({"role": new_role.role, "roleId": new_role.id})
-    if email:
-        await prisma.models.User.prisma().update(
-            where={"id": userId}, data={"email": email}
+    async with prisma.get_client().tx() as transaction:
+        user = await prisma.models.User.prisma(transaction).find_unique(
+            where={"id": userId}, include={"roles": True}
         )
-        update_data["email"] = email
+        if not user:
+            return UpdateUserResponse(success=False, userId=userId, updatedFields={})
+        if roles:
+            existing = {user_role.role for user_role in user.roles}
+            requested = list(dict.fromkeys(role.role for role in roles))
+            to_remove = existing.difference(requested)
+            to_add = [role for role in requested if role not in existing]
+            if to_remove:
+                await prisma.models.UserRole.prisma(transaction).delete_many(
+                    where={"userId": userId, "role": {"in": list(to_remove)}}
+                )
+            if to_add:
+                await prisma.models.UserRole.prisma(transaction).create_many(
+                    data=[{"role": role, "userId": userId} for role in to_add],
+                    skip_duplicates=True,
+                )
+            updated_roles_data = [{"role": role} for role in requested]
+        if email:
+            await prisma.models.User.prisma(transaction).update(
+                where={"id": userId}, data={"email": email}
+            )
     return UpdateUserResponse(
         success=True,
         userId=userId,